@@ -10,6 +10,7 @@ import asyncio
 import logging
 
 from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 from bapsf_motion.actors.base import EventActor
@@ -92,10 +93,10 @@ class Drive(EventActor):
 
         axes = self._validate_axes(axes)
 
-        axis_objs = []
-        for axis in axes:
-            ax = self._spawn_axis(axis)
-            axis_objs.append(ax)
+        # each axis opens a connection to its motor during instantiation,
+        # so spawn the axes concurrently to overlap the connection setup
+        with ThreadPoolExecutor(max_workers=max(len(axes), 1)) as executor:
+            axis_objs = list(executor.map(self._spawn_axis, axes))
 
         self._axes = tuple(axis_objs)
 
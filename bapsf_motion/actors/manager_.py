@@ -19,7 +19,7 @@ from bapsf_motion.actors.motion_group_ import (
     MotionGroupConfig,
     handle_user_metadata
 )
-from bapsf_motion.utils import toml, _deepcopy_dict
+from bapsf_motion.utils import toml, _deepcopy_dict, _load_toml_config
 
 
 class RunManagerConfig(UserDict):
@@ -43,17 +43,8 @@ class RunManagerConfig(UserDict):
             # we need to deep copy to avoid passing around actor objects
             # from the old config
             config = _deepcopy_dict(config)
-        elif isinstance(config, str):
-            # could be path to TOML file or a TOML like string
-            if Path(config).exists():
-                with open(config, "rb") as f:
-                    config = toml.load(f)
-            else:
-                config = toml.loads(config)
-        elif isinstance(config, Path):
-            # path to TOML file
-            with open(config, "rb") as f:
-                config = toml.load(f)
+        elif isinstance(config, (str, Path)):
+            config = _load_toml_config(config)
         elif not isinstance(config, dict):
             raise TypeError(
                 f"Expected 'config' to be of type dict, got type {type(config)}."
@@ -61,17 +52,15 @@ class RunManagerConfig(UserDict):
 
         # Check if the configuration has a data run header or just
         # the configuration
-        if len(self._manager_names - set(config.keys())) < len(self._manager_names) - 1:
+        man_names = self._manager_names & config.keys()
+        if len(man_names) > 1:
             raise ValueError(
                 "Unable to interpret configuration, since there appears"
                 " to be multiple data run configurations supplied."
             )
-        elif (len(self._manager_names - set(config.keys()))
-              == len(self._manager_names) - 1):
+        elif len(man_names) == 1:
             # data run found in config
-            man_name = tuple(
-                self._manager_names - (self._manager_names - set(config.keys()))
-            )[0]
+            man_name = next(iter(man_names))
             config = config[man_name]
 
             if not isinstance(config, dict):
@@ -121,7 +110,7 @@ class RunManagerConfig(UserDict):
         config["date"] = date
 
         # Are there motion groups
-        mg_names_not_in_config = self._mg_names - set(config)
+        mg_names_not_in_config = self._mg_names - config.keys()
         if len(mg_names_not_in_config) == len(self._mg_names):
             self.logger.error(
                 "ValueError: The run configuration has no defined motion groups, "
@@ -11,6 +11,7 @@ import logging
 import numpy as np
 
 from collections import UserDict
+from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 from bapsf_motion.actors.base import EventActor
@@ -18,7 +19,7 @@ from bapsf_motion.actors.drive_ import Drive
 from bapsf_motion.motion_builder import MotionBuilder
 from bapsf_motion.transform import BaseTransform
 from bapsf_motion import transform
-from bapsf_motion.utils import toml
+from bapsf_motion.utils import toml, _deepcopy_dict, _load_toml_config
 
 
 def handle_user_metadata(
@@ -31,7 +32,7 @@ def handle_user_metadata(
     configuration component, then collect all the metadata and
     store it under the 'user' key.  Return the modified dictionary.
     """
-    user_meta = set(config.keys()) - req_meta
+    user_meta = [key for key in config if key not in req_meta]
 
     if len(user_meta) == 0:
         return config
@@ -52,10 +53,9 @@ def handle_user_metadata(
             val = config.pop("user")
             config["user"] = {"key0": val}
     else:
-        config["user"] = dict()
+        config["user"] = {}
 
-    for key in user_meta:
-        config["user"][key] = config.pop(key)
+    config["user"].update({key: config.pop(key) for key in user_meta})
 
     if len(config["user"]) == 0:
         del config["user"]
@@ -74,10 +74,10 @@ class MotionGroupConfig(UserDict):
 
     Parameters
     ----------
-    config: `str` or `dict`
-        A TOML like string or dictionary defining the motion group
-        configuration.  See examples section below for additional
-        details.
+    config: `str`, `~pathlib.Path`, or `dict`
+        A TOML like string, path to a TOML file, or dictionary defining
+        the motion group configuration.  See examples section below for
+        additional details.
 
     Examples
     --------
@@ -224,61 +224,90 @@ class MotionGroupConfig(UserDict):
     """
     #: required keys for the motion group configuration dictionary
     _required_metadata = {
-        "motion_group": {
+        "motion_group": frozenset({
             "name",
             "drive",
             "transform",
             "motion_builder",
-        },
-        "drive": {"name", "axes"},
-        "drive.axes": {"ip", "units", "name", "units_per_rev"},
-        "transform": {"type"},
-        "motion_builder": {"space"},
-        "motion_builder.exclusions": {"type"},
-        "motion_builder.layers": {"type"},
-        # "motion_builder.space": {"label", "range", "num"},
+        }),
+        "drive": frozenset({"name", "axes"}),
+        "drive.axes": frozenset({"ip", "units", "name", "units_per_rev"}),
+        "transform": frozenset({"type"}),
+        "motion_builder": frozenset({"space"}),
+        "motion_builder.exclusion": frozenset({"type"}),
+        "motion_builder.layer": frozenset({"type"}),
+        # "motion_builder.space": frozenset({"label", "range", "num"}),
     }
 
     #: optional keys for the motion group configuration dictionary
     _optional_metadata = {
-        "motion_builder": {"exclusion", "layer"},
-        "drive.axes": {"motor_settings"},
+        "motion_builder": frozenset({"exclusion", "layer"}),
+        "drive.axes": frozenset({"motor_settings"}),
+    }
+
+    #: all keys (required and optional) recognized by the motion group
+    #: configuration dictionary, any other keys are user metadata
+    _allowed_metadata = {
+        "motion_group": _required_metadata["motion_group"],
+        "drive": _required_metadata["drive"],
+        "drive.axes": (
+            _required_metadata["drive.axes"] | _optional_metadata["drive.axes"]
+        ),
+        "motion_builder": (
+            _required_metadata["motion_builder"]
+            | _optional_metadata["motion_builder"]
+        ),
     }
 
     #: allowable motion group header names
-    _mg_names = {"motion_group", "mgroup", "mg"}
+    _mg_names = frozenset({"motion_group", "mgroup", "mg"})
 
     def __init__(
             self,
-            config: Union[str, Dict[str, Any]],
+            config: Union[str, Dict[str, Any], "MotionGroupConfig", Path],
             logger: logging.Logger = None,
     ):
         self.logger = logging.getLogger("MG_config") if logger is None else logger
 
+        self._drive = None
+        self._transform = None
+        self._motion_builder = None
+
+        if isinstance(config, MotionGroupConfig):
+            # This would happen if Manager is passing in a configuration.
+            # The configuration was already validated when it was
+            # created, so just take a snapshot of its contents.  Links
+            # to actor objects are not carried over.
+            super().__init__(config.data)
+            self._data = self.data
+            return
+
         # Make sure config is the right type, and is a dict by the
         # end of ths code block
-        if isinstance(config, MotionGroupConfig):
-            # This would happen if Manager is passing in a configuration
-            pass
-        elif isinstance(config, str):
-            # Assume config is a TOML like string
-            config = toml.loads(config)
-        elif not isinstance(config, dict):
+        if isinstance(config, (str, Path)):
+            # TOML like string or path to a TOML file, files are parsed
+            # through a cache keyed on their modification time
+            config = _load_toml_config(config)
+        elif isinstance(config, dict):
+            # validation modifies the configuration in place, so work on
+            # a copy to leave the caller's dictionary untouched
+            config = _deepcopy_dict(config)
+        else:
             raise TypeError(
                 f"Expected 'config' to be of type dict, got type {type(config)}."
             )
 
         # Check if the configuration has a motion group header or just
         # the configuration
-        mg_names = self._mg_names
-        if len(mg_names - set(config.keys())) < len(mg_names) - 1:
+        mg_names = self._mg_names & config.keys()
+        if len(mg_names) > 1:
             raise ValueError(
                 "Unable to interpret configuration, since there appears"
                 " to be multiple motion group configurations supplied."
             )
-        elif len(mg_names - set(config.keys())) == len(mg_names) - 1:
+        elif len(mg_names) == 1:
             # mg_name found in config
-            mg_name = tuple(mg_names - (mg_names - set(config.keys())))[0]
+            mg_name = next(iter(mg_names))
             config = config[mg_name]
 
             if not isinstance(config, dict):
@@ -287,13 +316,14 @@ class MotionGroupConfig(UserDict):
                     f"got type {type(config)}."
                 )
 
-        if "name" not in config and len(config) != 1:
-            raise ValueError(
-                "Unable to interpret configuration, since there appears"
-                " to be multiple motion group configurations supplied."
-            )
-        elif "name" not in config:
-            config = list(config.values())[0]
+        if "name" not in config:
+            if len(config) != 1:
+                raise ValueError(
+                    "Unable to interpret configuration, since there appears"
+                    " to be multiple motion group configurations supplied."
+                )
+
+            config = next(iter(config.values()))
 
             if not isinstance(config, dict):
                 raise TypeError(
@@ -303,9 +333,6 @@ class MotionGroupConfig(UserDict):
 
         # validate config
         config = self._validate_config(config)
-        self._drive = None
-        self._transform = None
-        self._motion_builder = None
 
         super().__init__(config)
         self._data = self.data
@@ -316,14 +343,17 @@ class MotionGroupConfig(UserDict):
         A real dictionary used to store the contents of
         `MotionGroupConfig`.
         """
-        if self._drive is not None:
-            self._data = {**self._data, "drive": self._drive.config}
-
-        if self._motion_builder is not None:
-            self._data = {**self._data, "motion_builder": self._motion_builder.config}
-
-        if self._transform is not None:
-            self._data = {**self._data, "transform": self._transform.config}
+        linked = {
+            key: obj.config
+            for key, obj in (
+                ("drive", self._drive),
+                ("motion_builder", self._motion_builder),
+                ("transform", self._transform),
+            )
+            if obj is not None
+        }
+        if linked:
+            self._data = {**self._data, **linked}
 
         return self._data
 
@@ -331,11 +361,39 @@ class MotionGroupConfig(UserDict):
     def data(self, value):
         self._data = value
 
+    # Item access is routed directly to self._data so only the requested
+    # component is pulled from a linked object, instead of composing
+    # the full dictionary via self.data on every access.
+    def __getitem__(self, key):
+        if key == "drive" and self._drive is not None:
+            return self._drive.config
+        elif key == "motion_builder" and self._motion_builder is not None:
+            return self._motion_builder.config
+        elif key == "transform" and self._transform is not None:
+            return self._transform.config
+
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
     def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate the motion group configuration dictionary."""
 
         # Check for root level required key-value pairs
-        missing_meta = self._required_metadata["motion_group"] - set(config.keys())
+        missing_meta = self._required_metadata["motion_group"] - config.keys()
         if missing_meta:
             self.logger.error(
                 f"ValueError: Supplied configuration is missing required root level "
@@ -353,9 +411,9 @@ class MotionGroupConfig(UserDict):
             config.get("motion_builder", {})
         )
 
-        req_meta = self._required_metadata.get("motion_group", set())
-        opt_meta = self._optional_metadata.get("motion_group", set())
-        config = self._handle_user_meta(config, set.union(req_meta, opt_meta))
+        config = self._handle_user_meta(
+            config, self._allowed_metadata["motion_group"]
+        )
 
         # TODO: the below commented out code block is not do-able since
         #       motion_builder.space can be defined as a string for builtin spaces
@@ -363,8 +421,10 @@ class MotionGroupConfig(UserDict):
         #       code block below can be reinstated.
         #
         # # check axis names are the same as the motion builder labels
-        # axis_labels = (ax["name"] for ax in config["drive"]["axes"].values())
-        # ml_labels = tuple(config["motion_builder"]["label"])
+        # axis_labels = tuple(ax["name"] for ax in config["drive"]["axes"].values())
+        # ml_labels = tuple(
+        #     sp["label"] for sp in config["motion_builder"]["space"].values()
+        # )
         # if axis_labels != ml_labels:
         #     raise ValueError(
         #         f"The Motion List space and Axes must have the same "
@@ -378,10 +438,9 @@ class MotionGroupConfig(UserDict):
         """
         Validate the drive component of the motion group configuration.
         """
-        req_meta = self._required_metadata.get("drive", set())
-        opt_meta = self._optional_metadata.get("drive", set())
+        req_meta = self._required_metadata["drive"]
 
-        missing_meta = req_meta - set(config.keys())
+        missing_meta = req_meta - config.keys()
         if missing_meta:
             self.logger.error(
                 f"ValueError: Supplied configuration for Drive is missing "
@@ -393,42 +452,63 @@ class MotionGroupConfig(UserDict):
             # )
             return {}
 
-        config = self._handle_user_meta(config, set.union(req_meta, opt_meta))
+        config = self._handle_user_meta(config, self._allowed_metadata["drive"])
 
-        ax_meta = set(config["axes"].keys())
-        if len(self._required_metadata["drive.axes"] - ax_meta) == 0:
-            # assume drive only has one axis
+        if self._required_metadata["drive.axes"].issubset(config["axes"]):
             ax_config = config.pop("axes")
-            config["axes"][0] = ax_config
 
-        for ax_id, ax_config in config["axes"].items():
-            # TODO: is there a good way of enforcing ax_id to be an int
-            #       starting at 0 and monotonically increasing
-            try:
-                config["axes"][ax_id] = self._validate_axis(ax_config)
-            except ValueError as err:
-                self.logger.error(f"{err.__class__.__name__}: {err}")
-                self.logger.error(
-                    "Drive axes are not configured properly, so discarding "
-                    "drive."
-                )
-                return {}
+            if not isinstance(ax_config["ip"], (list, tuple)):
+                # assume drive only has one axis
+                config["axes"] = {0: ax_config}
+            else:
+                # axes are defined column-wise (e.g. axes.ip = [...]), so
+                # transpose into a per-axis configuration
+                if not all(
+                    isinstance(val, (list, tuple)) for val in ax_config.values()
+                ) or len({len(val) for val in ax_config.values()}) != 1:
+                    self.logger.error(
+                        "ValueError: Drive axes defined column-wise must have "
+                        "a list of values for every key, each with the same "
+                        "length as the number of axes."
+                    )
+                    return {}
+
+                keys = tuple(ax_config)
+                config["axes"] = {
+                    ii: dict(zip(keys, row))
+                    for ii, row in enumerate(zip(*ax_config.values()))
+                }
+
+        # TODO: is there a good way of enforcing ax_id to be an int
+        #       starting at 0 and monotonically increasing
+        try:
+            config["axes"] = {
+                ax_id: self._validate_axis(ax_config)
+                for ax_id, ax_config in config["axes"].items()
+            }
+        except ValueError as err:
+            self.logger.error(f"{err.__class__.__name__}: {err}")
+            self.logger.error(
+                "Drive axes are not configured properly, so discarding "
+                "drive."
+            )
+            return {}
 
         # ensure all axis names and ips are unique
         naxes = len(config["axes"])
-        for key in {"name", "ip"}:
-            vals = [val[key] for val in config["axes"].values()]
+        for key in ("name", "ip"):
+            unique_vals = {val[key] for val in config["axes"].values()}
 
-            if len(set(vals)) != naxes:
+            if len(unique_vals) < naxes:
                 self.logger.error(
                     f"ValueError: The axes of the configured probe drive do NOT have"
                     f" unique {key}s.  The drive has {naxes} and only "
-                    f"{len(set(vals))} unique {key}s, {set(vals)}."
+                    f"{len(unique_vals)} unique {key}s, {unique_vals}."
                 )
                 # raise ValueError(
                 #     f"The axes of the configured probe drive do NOT have"
                 #     f" unique {key}s.  The drive has {naxes} and only "
-                #     f"{len(set(vals))} unique {key}s, {set(vals)}."
+                #     f"{len(unique_vals)} unique {key}s, {unique_vals}."
                 # )
                 return {}
 
@@ -439,17 +519,16 @@ class MotionGroupConfig(UserDict):
         Validate the axis (e.g. axes.0) component of the drive
         component of the motion group configuration.
         """
-        req_meta = self._required_metadata.get("drive.axes", set())
-        opt_meta = self._optional_metadata.get("drive.axes", set())
+        req_meta = self._required_metadata["drive.axes"]
 
-        missing_meta = req_meta - set(config.keys())
+        missing_meta = req_meta - config.keys()
         if missing_meta:
             raise ValueError(
                 f"Supplied configuration for Axis is missing required "
                 f"keys {missing_meta}."
             )
 
-        config = self._handle_user_meta(config, set.union(req_meta, opt_meta))
+        config = self._handle_user_meta(config, self._allowed_metadata["drive.axes"])
 
         # TODO: Is it better to do the type checks here or allow class
         #       instantiation to handle it.
@@ -462,9 +541,8 @@ class MotionGroupConfig(UserDict):
         configuration.
         """
         req_meta = self._required_metadata["motion_builder"]
-        opt_meta = self._optional_metadata["motion_builder"]
 
-        missing_meta = req_meta - set(config.keys())
+        missing_meta = req_meta - config.keys()
         if missing_meta:
             self.logger.error(
                 f"ValueError: Supplied configuration for MotionBuilder is missing "
@@ -476,11 +554,13 @@ class MotionGroupConfig(UserDict):
             # )
             return {}
 
-        config = self._handle_user_meta(config, set.union(req_meta, opt_meta))
+        config = self._handle_user_meta(
+            config, self._allowed_metadata["motion_builder"]
+        )
 
         # now check for requited meta keys of the lower level required
         # keys (i.e. layers and exceptions)
-        for key in opt_meta:
+        for key in self._optional_metadata["motion_builder"]:
             try:
                 sub_config = config[key]
             except KeyError:
@@ -505,7 +585,7 @@ class MotionGroupConfig(UserDict):
             if "type" in sub_config.keys():
                 # there's only 1 item with required meta 'type'
 
-                missing_meta = rmeta - set(sub_config.keys())
+                missing_meta = rmeta - sub_config.keys()
                 if missing_meta:
                     self.logger.error(
                         f"ValueError: Supplied configuration for motion_builder.{key} is "
@@ -517,7 +597,7 @@ class MotionGroupConfig(UserDict):
                     # )
                     return {}
 
-                config[key][0] = config.pop(key)
+                config[key] = {0: config.pop(key)}
 
                 continue
 
@@ -526,15 +606,15 @@ class MotionGroupConfig(UserDict):
                     self.logger.error(
                         f"ValueError: Expected type dict for the "
                         f"motion_builder.{key}.{sck} configuration, got type "
-                        f"{type(sub_config)}."
+                        f"{type(scv)}."
                     )
                     # raise ValueError(
                     #     f"Expected type dict for the motion_builder.{key}.{sck} "
-                    #     f"configuration, got type {type(sub_config)}."
+                    #     f"configuration, got type {type(scv)}."
                     # )
                     return {}
 
-                missing_meta = rmeta - set(scv.keys())
+                missing_meta = rmeta - scv.keys()
                 if missing_meta:
                     self.logger.error(
                         f"Supplied configuration for motion_builder.{key}.{sck} is "
@@ -555,7 +635,7 @@ class MotionGroupConfig(UserDict):
         """
         req_meta = self._required_metadata["transform"]
 
-        missing_meta = req_meta - set(config.keys())
+        missing_meta = req_meta - config.keys()
         if missing_meta:
             self.logger.error(
                 f"ValueError: Supplied configuration for Transformer is missing required "
@@ -618,7 +698,7 @@ class MotionGroupConfig(UserDict):
 
         self._drive = drive
 
-    def link_transform(self, tr: transform.BaseTransform):
+    def link_transform(self, tr: BaseTransform):
         """
         Link the 'transform' configuration component to an instance of
         a subclass of `~bapsf_motion.transform.base.BaseTransform`.
@@ -626,15 +706,15 @@ class MotionGroupConfig(UserDict):
         pulled from the :attr:`config` property of that transform
         instance.
         """
-        if not isinstance(tr, transform.BaseTransform):
+        if not isinstance(tr, BaseTransform):
             self.logger.error(
                 f"TypeError: For argument 'tr' expected a subclass of "
-                f"{transform.BaseTransform}, but got type {type(tr)}.  Not linking "
+                f"{BaseTransform}, but got type {type(tr)}.  Not linking "
                 f"transform."
             )
             # raise TypeError(
             #     f"For argument 'tr' expected a subclass of "
-            #     f"{transform.BaseTransform}, but got type {type(tr)}."
+            #     f"{BaseTransform}, but got type {type(tr)}."
             # )
             return
 
@@ -706,6 +786,15 @@ class MotionGroup(EventActor):
     #          configuration build mode
     #       3. 'test' would probably be inbetween the the above two
     #          mode since it's intended for debugging purposes
+
+    #: string aliases accepted by :meth:`move_ml` mapped to a function
+    #: that resolves the alias into a motion list index
+    _ml_index_aliases = {
+        "next": lambda mg: 0 if mg.ml_index is None else mg.ml_index + 1,
+        "first": lambda mg: 0,
+        "last": lambda mg: mg.mb.motion_list.sizes["index"] - 1,
+    }
+
     def __init__(
         self,
         config: Union[str, Dict[str, Any]] = None,
@@ -828,21 +917,17 @@ class MotionGroup(EventActor):
             self._mb = None
             return self._mb
 
-        # initialize the motion builder object
-        mb_config = config.copy()
-
-        for key in {"name", "user"}:
-            mb_config.pop(key, None)
-
+        # initialize the motion builder object, only the space, layer,
+        # and exclusion entries are read so config does not need to be
+        # copied
         _inputs = {}
         for key, _kwarg in zip(
                 ("space", "layer", "exclusion"),
                 ("space", "layers", "exclusions"),
         ):
-            try:
-                _inputs[_kwarg] = list(mb_config.pop(key).values())
-            except KeyError:
-                continue
+            val = config.get(key, None)
+            if val is not None:
+                _inputs[_kwarg] = list(val.values())
 
         self._mb = MotionBuilder(**_inputs)
         return self._mb
@@ -855,8 +940,8 @@ class MotionGroup(EventActor):
             self._transform = None
             return self._transform
 
-        tr_config = config.copy()
-        tr_type = tr_config.pop("type")
+        tr_type = config["type"]
+        tr_config = {key: val for key, val in config.items() if key != "type"}
         self._transform = transform.transform_factory(
             self.drive, tr_type=tr_type, **tr_config
         )
@@ -895,10 +980,11 @@ class MotionGroup(EventActor):
             raise ValueError(
                 f"Expected type int for 'index', got {type(index)}"
             )
-        elif not np.isin(index, self.mb.motion_list.index):
+        elif not 0 <= index < self.mb.motion_list.sizes["index"]:
+            # motion list indices are always the contiguous range [0, size)
             raise ValueError(
                 f"Given index {index} is out of range, "
-                f"[0, {self.mb.motion_list.index.size}]."
+                f"[0, {self.mb.motion_list.sizes['index']}]."
             )
 
         self._ml_index = index
@@ -919,7 +1005,7 @@ class MotionGroup(EventActor):
         """
         dr_pos = self.drive.position
         pos = self.transform(
-            dr_pos.value.tolist(),
+            dr_pos.value,
             to_coords="motion_space",
         ).squeeze()
         return pos * dr_pos.unit
@@ -963,15 +1049,11 @@ class MotionGroup(EventActor):
         """
         Move the probe drive to a specific index of the motion list.
         """
-        if index == "next":
-            index = 0 if self.ml_index is None else self.ml_index + 1
-        elif index == "first":
-            index = 0
-        elif index == "last":
-            index = self.mb.motion_list.index[-1].item()
+        if isinstance(index, str) and index in self._ml_index_aliases:
+            index = self._ml_index_aliases[index](self)
 
         self.ml_index = index
-        pos = self.mb.motion_list.sel(index=index).to_numpy().tolist()
+        pos = self.mb.motion_list.sel(index=index).to_numpy()
 
         return self.move_to(pos=pos)
 
@@ -1102,7 +1184,7 @@ class MotionGroup(EventActor):
             )
             self._transform = None
             return
-        elif isinstance(tr, transform.BaseTransform):
+        elif isinstance(tr, BaseTransform):
             if tr.dimensionality in (-1, self.drive.naxes):
                 config = tr.config.copy()
             else:
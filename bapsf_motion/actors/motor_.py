@@ -19,7 +19,7 @@ from enum import Enum
 from typing import Any, AnyStr, Callable, Dict, NamedTuple, Optional, Union
 
 from bapsf_motion.actors.base import EventActor
-from bapsf_motion.utils import ipv4_pattern, SimpleSignal
+from bapsf_motion.utils import is_valid_ipv4, SimpleSignal
 from bapsf_motion.utils import units as u
 
 
@@ -475,10 +475,43 @@ class Motor(EventActor):
             "(Flex I/O drives only)",
     }
 
+    #: status flags reported through the "request_status" command
+    _status_flags = (
+        "alarm",
+        "enabled",
+        "fault",
+        "moving",
+        "homing",
+        "jogging",
+        "motion_in_progress",
+        "in_position",
+        "stopping",
+        "waiting",
+    )
+
+    #: mapping of motor status letters (returned by the "request_status"
+    #: command) to the status key and value they set
+    _status_letters = {
+        "A": ("alarm", True),
+        "D": ("enabled", False),
+        "E": ("fault", True),
+        "F": ("moving", True),
+        "H": ("homing", True),
+        "J": ("jogging", True),
+        "M": ("motion_in_progress", True),
+        "P": ("in_position", True),
+        "R": ("enabled", True),
+        "S": ("stopping", True),
+        "T": ("waiting", True),
+        "W": ("waiting", True),
+    }
+
+    #: regular expression pattern for parsing the Nack code from a
+    #: motor response string
+    _nack_pattern = re.compile(r"\d?\?(?P<code>\d{1,2})")
+
     ack_flags = AckFlags
 
-    # TODO: update _heartbeat so the beat happens on the specified HR
-    #       interval instead of execution time + HR interval
     # TODO: implement a "jog_by" "FL" "feed to length"
     # TODO: implement commands for setting/getting jog speed, accel,
     #       and decel
@@ -530,6 +563,10 @@ class Motor(EventActor):
 
         self._pause_heartbeat = False
 
+        # bytes received from the motor that belong to a response not
+        # yet returned by self._recv
+        self._recv_buffer = bytearray()
+
         try:
             super().__init__(
                 name=name,
@@ -757,17 +794,12 @@ class Motor(EventActor):
         rtn = self.send_command("protocol")
         if self._lost_connection(rtn) or rtn == self.ack_flags.MALFORMED:
             return
-        _bits = f"{rtn:09b}"
 
-        if _bits[-3] == "0":
+        _ack_nack_bit = 1 << 2
+        if not rtn & _ack_nack_bit:
             # motor does not always respond with ack/nack, change
             # protocol, so it does
-            _bits = list(_bits)
-            _bits[-3] = "1"  # sets always ack/nack
-            _bits = "".join(_bits)
-            _bits = int(_bits, 2)
-
-            self.send_command("protocol", _bits)
+            self.send_command("protocol", rtn | _ack_nack_bit)
 
             # if Ack/Nack was not set to begin with, then the first protocol
             # setting will not have an Ack/Nack return.  Thus, lets retrieve
@@ -776,7 +808,6 @@ class Motor(EventActor):
             rtn = self.send_command("protocol")
             if self._lost_connection(rtn) or rtn == self.ack_flags.MALFORMED:
                 return
-            _bits = f"{rtn:09b}"
 
         self._motor["protocol_settings"] = []
         _bit_descriptions = [
@@ -790,12 +821,9 @@ class Motor(EventActor):
             "Little/Big Endian in Modbus Mode",
             "Full Duplex in RS-422",
         ]
-        for ii, b in enumerate(list(_bits)):
-            if b == "0":
-                continue
-
-            bit_num = 8 - ii
-            self._motor["protocol_settings"].append(_bit_descriptions[bit_num])
+        for bit_num in range(8, -1, -1):
+            if rtn & (1 << bit_num):
+                self._motor["protocol_settings"].append(_bit_descriptions[bit_num])
 
     def _get_motor_parameters(self):
         """Get current motor parameters."""
@@ -816,8 +844,8 @@ class Motor(EventActor):
 
     @ip.setter
     def ip(self, value):
-        # TODO: update ipv4_pattern so the port number can be passed with the
-        #       ip argument
+        # TODO: update IP validation so the port number can be passed with
+        #       the ip argument
         if self._motor["ip"] is not None:
             self.logger.warning(
                 "The motor's IP address can only be defined at object"
@@ -825,7 +853,12 @@ class Motor(EventActor):
             )
             return
 
-        if ipv4_pattern.fullmatch(value) is None:
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Expected type str for the IP address, got type {type(value)}."
+            )
+
+        if not is_valid_ipv4(value):
             raise ValueError(f"Supplied IP address ({value}) is not a valid IPv4.")
 
         self._motor["ip"] = value
@@ -871,6 +904,9 @@ class Motor(EventActor):
 
         self._setup["socket"] = value
 
+        # any buffered bytes came from the previous connection
+        self._recv_buffer.clear()
+
     @property
     def is_moving(self) -> bool:
         """`True` if the motor is actively moving, `False` otherwise."""
@@ -957,15 +993,18 @@ class Motor(EventActor):
         """
         Update ``self._status` dictionary with the given arguments ``**values``.
         """
-        old_status = self.status.copy()
-        new_status = {**old_status, **values}
-        changed = {}
-        for key, value in new_status.items():
-            if key not in old_status or (key in old_status and old_status[key] != value):
-                changed[key] = value
+        # only keys in values can change, so only those are compared
+        old_status = self._status
+        changed = {
+            key: value
+            for key, value in values.items()
+            if key not in old_status or old_status[key] != value
+        }
 
         if changed:
-            self._status = new_status
+            # replace instead of updating in place, so a status dict
+            # being read from another thread is never mutated
+            self._status = {**old_status, **changed}
             self.logger.debug(f"Motor status changed, new values are {changed}.")
             self.status_changed.emit()
 
@@ -1010,6 +1049,12 @@ class Motor(EventActor):
                 s.settimeout(1)  # 1 second timeout
                 s.connect((self.ip, self.port))
 
+                # commands are small request/response messages, so send
+                # them immediately instead of letting Nagle's algorithm
+                # delay them waiting on an ACK
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
                 msg = "...SUCCESS!!!"
                 self.logger.info(msg)
                 self.socket = s
@@ -1080,6 +1125,17 @@ class Motor(EventActor):
 
         return _rtn
 
+    def _in_loop_thread(self) -> bool:
+        """
+        `True` if the caller is executing in the thread of the running
+        `event loop`_, `False` otherwise.
+        """
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            # no event loop is running in the calling thread
+            return False
+
     async def _send_command_async(self, command: str, *args):
         """A coroutine_ version of :meth:`_send_command`."""
         return self._send_command(command, *args)
@@ -1118,13 +1174,11 @@ class Motor(EventActor):
 
         elif (
             (thread_id is not None and threading.current_thread().ident == thread_id)
-            or (threading.current_thread().ident == self._thread_id)
+            or self._in_loop_thread()
         ):
             # we are in the same thread as the running event loop, just
             # send the command directly
-            tk = self.loop.create_task(self._send_command_async(command, *args))
-            self.loop.run_until_complete(tk)
-            return tk.result()
+            return self._send_command(command, *args)
 
         # the event loop is running and the command is being sent from
         # outside the event loop thread
@@ -1165,7 +1219,7 @@ class Motor(EventActor):
         cmd_dict = self._commands[command]
         cmd_str = cmd_dict["send"]
 
-        processor = self._commands[command]["send_processor"]
+        processor = cmd_dict["send_processor"]
         if processor is None:
             # If "send_processor" is None, then it is assumed no values
             # need to be sent with the command.
@@ -1176,8 +1230,7 @@ class Motor(EventActor):
                 )
             return cmd_str
 
-        two_way = cmd_dict.get("two_way", False)
-        if not len(args) and two_way:
+        if not len(args) and cmd_dict["two_way"]:
             # command is being used as a getter instead of a setter
             return cmd_str
         elif not len(args):
@@ -1230,9 +1283,7 @@ class Motor(EventActor):
             return self.ack_flags.ACK_QUEUED
         elif "?" in rtn_str:
             # Motor negatively acknowledge command, error in command
-            err_code = re.compile(
-                r"\d?\?(?P<code>\d{1,2})"
-            ).fullmatch(rtn_str).group("code")
+            err_code = self._nack_pattern.fullmatch(rtn_str).group("code")
             err_code = int(err_code)
             err_msg = f"{err_code} - {self._nack_codes[err_code]}"
             self.logger.error(
@@ -1336,7 +1387,7 @@ class Motor(EventActor):
         _header = b"\x00\x07"
         _eom = b"\r"  # end of message
 
-        cmd_str = _header + bytes(cmd.encode("ASCII")) + _eom
+        cmd_str = _header + cmd.encode("ASCII") + _eom
         self.logger.debug(f"Sending command string '{cmd_str}'.")
         try:
             self.socket.sendall(cmd_str)
@@ -1384,20 +1435,34 @@ class Motor(EventActor):
         _header = b"\x00\x07"
         _eom = b"\r"  # end of message
 
-        msg = b""
-        while True:
-            data = self.socket.recv(16)
+        # read into a persistent buffer so any bytes received past the
+        # end-of-message are kept for the next response
+        buffer = self._recv_buffer
+        eom_index = buffer.find(_eom)
+        while eom_index == -1:
+            try:
+                data = self.socket.recv(1024)
+            except OSError:
+                # discard the partial response
+                buffer.clear()
+                raise
 
             if not data:
                 break
-            elif not msg and _header in data:
-                msg = data.split(_header)[1]
-            else:
-                msg += data
 
-            if _eom in msg:
-                msg = msg.split(_eom)[0]
-                break
+            buffer += data
+            eom_index = buffer.find(_eom, len(buffer) - len(data))
+
+        if eom_index == -1:
+            msg = bytes(buffer)
+            buffer.clear()
+        else:
+            msg = bytes(buffer[:eom_index])
+            del buffer[:eom_index + 1]
+
+        header_index = msg.find(_header)
+        if header_index != -1:
+            msg = msg[header_index + len(_header):]
 
         self.logger.debug(f"Received string '{msg}'.")
         return msg
@@ -1429,39 +1494,14 @@ class Motor(EventActor):
             _rtn = ""
             _status = {}
         else:
-            _status = {
-                "alarm": False,
-                "enabled": False,
-                "fault": False,
-                "moving": False,
-                "homing": False,
-                "jogging": False,
-                "motion_in_progress": False,
-                "in_position": False,
-                "stopping": False,
-                "waiting": False,
-            }  # null status
+            _status = dict.fromkeys(self._status_flags, False)  # null status
         for letter in _rtn:
-            if letter == "A":
-                _status["alarm"] = True
-            elif letter in ("D", "R"):
-                _status["enabled"] = True if letter == "R" else False
-            elif letter == "E":
-                _status["fault"] = True
-            elif letter == "F":
-                _status["moving"] = True
-            elif letter == "H":
-                _status["homing"] = True
-            elif letter == "J":
-                _status["jogging"] = True
-            elif letter == "M":
-                _status["motion_in_progress"] = True
-            elif letter == "P":
-                _status["in_position"] = True
-            elif letter == "S":
-                _status["stopping"] = True
-            elif letter in ("T", "W"):
-                _status["waiting"] = True
+            name = self._status_letters.get(letter)
+            if name is None:
+                continue
+
+            key, value = name
+            _status[key] = value
 
         pos = send_command("get_position")
         if not isinstance(pos, self.ack_flags):
@@ -1519,18 +1559,15 @@ class Motor(EventActor):
         if isinstance(rtn, self.ack_flags):
             return rtn
 
-        codes = []
-        for i, digit in enumerate(rtn):
-            integer = int(digit)
-            codes.append(integer * 10**(3-i))
+        codes = [
+            int(digit) * place for digit, place in zip(rtn, (1000, 100, 10, 1))
+        ]
 
         alarm_message = []
         for code in codes:
-            try:
-                msg = self._alarm_codes[code]
+            msg = self._alarm_codes.get(code)
+            if msg is not None:
                 alarm_message.append(f"{code:04d} - {msg}")
-            except KeyError:
-                pass
 
         alarm_message = " :: ".join(alarm_message)
 
@@ -1573,6 +1610,7 @@ class Motor(EventActor):
         """
         old_HR = self.heartrate.BASE
         beats = 0
+        next_beat = self.loop.time()
         while True:
             if self.terminated:
                 # Motor is terminated or being terminated, so end the coroutine
@@ -1605,7 +1643,18 @@ class Motor(EventActor):
 
             beats += 1
             old_HR = heartrate
-            await asyncio.sleep(heartrate)
+
+            # schedule the next beat one HR interval after this beat was
+            # scheduled, so the interval includes the time spent
+            # retrieving the motor status
+            next_beat += heartrate
+            now = self.loop.time()
+            if next_beat < now:
+                # beat ran longer than the HR interval, beat again
+                # immediately instead of trying to catch up on missed beats
+                next_beat = now
+
+            await asyncio.sleep(next_beat - now)
 
     def terminate(self, delay_loop_stop=False):
         self.logger.info("Terminating motor")
@@ -1736,18 +1785,28 @@ class Motor(EventActor):
         ----------
         delay: ~numbers.Real
             Number of seconds to sleep.
+
+        Raises
+        ------
+        RuntimeError
+            If called from within the running event loop thread.  A
+            blocking sleep there would stall every actor sharing the
+            loop, so await :meth:`_sleep_async` instead.
         """
         if not self.loop.is_running():
             time.sleep(delay)
-        elif threading.current_thread().ident == self._thread_id:
-            tk = self.loop.create_task(self._sleep_async(delay))
-            self.loop.run_until_complete(tk)
+            return
+        elif self._in_loop_thread():
+            raise RuntimeError(
+                "Motor.sleep() can not be called from within the running "
+                "event loop thread, await Motor._sleep_async() instead."
+            )
 
         future = asyncio.run_coroutine_threadsafe(
             self._sleep_async(delay),
             self.loop
         )
-        future.result(5)
+        future.result(delay + 5)
 
     def set_current(self, percent):
         r"""
@@ -40,7 +40,7 @@ from bapsf_motion.actors import RunManager, RunManagerConfig, MotionGroup
 from bapsf_motion.gui.configure.helpers import gui_logger, gui_logger_config_dict
 from bapsf_motion.gui.configure.motion_group_widget import MGWidget
 from bapsf_motion.gui.widgets import QLogger, StyleButton, VLinePlain
-from bapsf_motion.utils import toml, _deepcopy_dict
+from bapsf_motion.utils import toml, _deepcopy_dict, _load_toml_config
 
 
 class RunWidget(QWidget):
@@ -417,8 +417,7 @@ class ConfigureGUI(QMainWindow):
 
         self.logger.info(f"Opening and reading file: {file_name} ...")
 
-        with open(file_name, "rb") as f:
-            run_config = toml.load(f)
+        run_config = toml.load_file(file_name)
 
         self.replace_rm(run_config)
         self._OPENED_FILE = file_name
@@ -502,17 +501,8 @@ class ConfigureGUI(QMainWindow):
         if defaults is None:
             self._defaults = None
             return
-        elif isinstance(defaults, str):
-            # could be path to TOML file or a TOML like string
-            if Path(defaults).exists():
-                with open(defaults, "rb") as f:
-                    defaults = toml.load(f)
-            else:
-                defaults = toml.loads(defaults)
-        elif isinstance(defaults, Path):
-            # path to TOML file
-            with open(defaults, "rb") as f:
-                defaults = toml.load(f)
+        elif isinstance(defaults, (str, Path)):
+            defaults = _load_toml_config(defaults)
         elif not isinstance(defaults, dict):
             raise TypeError(
                 f"Expected 'defaults' to be of type dict, got type {type(defaults)}."
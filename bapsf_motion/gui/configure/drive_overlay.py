@@ -27,7 +27,7 @@ from bapsf_motion.gui.widgets import (
     LED,
     StyleButton,
 )
-from bapsf_motion.utils import ipv4_pattern, _deepcopy_dict, loop_safe_stop
+from bapsf_motion.utils import is_valid_ipv4, _deepcopy_dict, loop_safe_stop
 
 
 class AxisConfigWidget(QWidget):
@@ -371,7 +371,7 @@ class AxisConfigWidget(QWidget):
         if ip == self.axis_config["ip"]:
             # ip did not change
             return ip
-        elif ipv4_pattern.fullmatch(ip) is None:
+        elif not is_valid_ipv4(ip):
             self.logger.error(
                 f"Supplied IP address ({ip}) is not a valid IPv4."
             )
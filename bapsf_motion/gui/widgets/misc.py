@@ -12,14 +12,12 @@ from PySide6.QtCore import Signal
 from PySide6.QtGui import QValidator, QColor
 from PySide6.QtWidgets import QLineEdit, QFrame,QWidget
 
-from bapsf_motion.utils import ipv4_pattern as _ipv4_pattern
+from bapsf_motion.utils import is_valid_ipv4 as _is_valid_ipv4
 
 
 class IPv4Validator(QValidator):
     def __init__(self, logger=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._pattern = _ipv4_pattern
-
         log_name = "" if logger is None else f"{logger.name}."
         log_name += "IPv4Validator"
         self._logger = logging.getLogger(log_name)
@@ -27,8 +25,7 @@ class IPv4Validator(QValidator):
     def validate(self, arg__1: str, arg__2: int) -> object:
         string = arg__1.replace("_", "")
 
-        match = self._pattern.fullmatch(string)
-        if match is None:
+        if not _is_valid_ipv4(string):
             self._logger.warning(f"IP address is invalid, '{string}'.")
             return QValidator.State.Intermediate
 
@@ -237,7 +237,9 @@ class LaPDXYTransform(base.BaseTransform):
             # - points is in LaPD motion space coordinates
             # - need to convert motion space coordinates to non-droop
             #   scenario before doing matrix multiplication
-            points = self._condition_points(points)
+            # - copy since the steps below write into points and
+            #   _condition_points does not copy array input
+            points = self._condition_points(points).copy()
 
             # 1. convert to ball valve coords
             _sign = 1 if self.deployed_side == "East" else -1
@@ -0,0 +1,25 @@
+"""Tests for the LaPD transforms in `bapsf_motion.transform.lapd`."""
+import numpy as np
+
+from bapsf_motion.transform import LaPDXYTransform
+
+
+def test_droop_correct_does_not_modify_input():
+    transform = LaPDXYTransform(
+        ["x", "y"],
+        pivot_to_center=62.94,
+        pivot_to_drive=133.51,
+        pivot_to_feedthru=21.6,
+        probe_axis_offset=20.16,
+        droop_correct=True,
+    )
+    points = np.array([[-3.0, 2.0], [5.0, -5.0]])
+    expected = points.copy()
+
+    transform(points, to_coords="drive")
+    np.testing.assert_array_equal(points, expected)
+
+    # a single point is the shape MotionGroup.move_ml passes in
+    point = points[0]
+    transform(point, to_coords="drive")
+    np.testing.assert_array_equal(point, expected[0])
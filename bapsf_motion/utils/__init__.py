@@ -4,6 +4,7 @@ __all__ = [
     "steps",
     "rev",
     "ipv4_pattern",
+    "is_valid_ipv4",
     "load_example",
     "units",
     "SimpleSignal",
@@ -12,6 +13,8 @@ __all__ = [
     "dict_equal"
 ]
 import asyncio
+import functools
+import ipaddress
 import re
 import time
 
@@ -19,45 +22,103 @@ from astropy import units
 from collections import UserDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from bapsf_motion.utils import exceptions, toml
 from bapsf_motion.utils.units_ import units, counts, steps, rev
 
 _HERE = Path(__file__).resolve().parent
-_EXAMPLES = (_HERE / ".." / "examples").resolve()
+_EXAMPLES = _HERE.parent / "examples"
 
 #: Regular expression pattern for parsing IPv4 addresses
-ipv4_pattern = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+ipv4_pattern = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", re.ASCII)
+
+
+def is_valid_ipv4(ip) -> bool:
+    """
+    Check if ``ip`` is a valid IPv4 address in dotted-decimal notation.
+
+    The address must match `ipv4_pattern`, have no zero-padded octets,
+    and be accepted by `ipaddress.IPv4Address` (i.e. each octet is in
+    the range 0-255).  Zero-padded octets are rejected explicitly since
+    `ipaddress` only rejects them on Python 3.9.5+.
+
+    Parameters
+    ----------
+    ip : str
+        The IP address to validate.
+
+    Returns
+    -------
+    bool
+        `True` if ``ip`` is a valid IPv4 address, `False` otherwise.
+
+    Examples
+    --------
+    >>> is_valid_ipv4("192.168.6.1")
+    True
+    >>> is_valid_ipv4("192.168.6.256")
+    False
+    >>> is_valid_ipv4("192.168.006.001")
+    False
+    """
+    if not isinstance(ip, str) or ipv4_pattern.fullmatch(ip) is None:
+        return False
+
+    if any(len(octet) > 1 and octet[0] == "0" for octet in ip.split(".")):
+        return False
+
+    try:
+        ipaddress.IPv4Address(ip)
+    except ValueError:
+        return False
+
+    return True
 
 
 class SimpleSignal:
-    _handlers = None
+    def __init__(self):
+        self._handlers = []
 
     @property
     def handlers(self):
-        if self._handlers is None:
-            self._handlers = []
         return self._handlers
 
     def connect(self, func):
-        if func not in self.handlers:
-            self.handlers.append(func)
+        if func not in self._handlers:
+            self._handlers.append(func)
 
     def disconnect(self, func=None):
         try:
-            self.handlers.remove(func)
+            self._handlers.remove(func)
         except ValueError:
             pass
 
     def disconnect_all(self):
-        self._handlers = None
+        self._handlers = []
 
     def emit(self):
-        for handler in self.handlers:
+        if not self._handlers:
+            return
+
+        # iterate over a snapshot, so a handler can disconnect itself
+        for handler in tuple(self._handlers):
             handler()
 
 
+@functools.lru_cache(maxsize=None)
+def _example_files() -> Dict[str, Path]:
+    """
+    Dictionary mapping the name of each packaged example TOML file to
+    its path.  The examples directory is only scanned on first use.
+    """
+    return {
+        _file.name: _file
+        for _file in _EXAMPLES.iterdir()
+        if _file.suffix == ".toml"
+    }
+
+
 def load_example(filename: str, as_string=False):
     """
     Load an example TOML file from `bapsf_motion.examples`.
@@ -77,18 +138,24 @@ def load_example(filename: str, as_string=False):
     config: `dict` or `str`
         Return the example configuration.
     """
-    _file = (_EXAMPLES / filename).resolve()
+    _file = _example_files().get(filename)
+
+    if _file is None:
+        # not a known packaged example, fall back to a
+        # path lookup in the examples directory
+        _file = (_EXAMPLES / filename).resolve()
 
-    if not _file.exists():
-        raise ValueError(
-            f"The specified example file {filename} does not exist in "
-            f"the examples directory {_EXAMPLES}."
-        )
-    elif not _file.is_file():
-        raise ValueError(f"The specified example file {filename} is not a file.")
+        if not _file.exists():
+            raise ValueError(
+                f"The specified example file {filename} does not exist in "
+                f"the examples directory {_EXAMPLES}."
+            )
+        elif not _file.is_file():
+            raise ValueError(
+                f"The specified example file {filename} is not a file."
+            )
 
-    with open(_file, "rb") as f:
-        config = toml.load(f)
+    config = toml.load_file(_file)
 
     if as_string:
         config = toml.dumps(config)
@@ -96,6 +163,31 @@ def load_example(filename: str, as_string=False):
     return config
 
 
+def _load_toml_config(config):
+    """
+    If ``config`` is a path to a TOML file or a TOML like string, then
+    return the parsed configuration dictionary.  Otherwise, ``config``
+    is returned unchanged.
+    """
+    if isinstance(config, str):
+        # could be path to TOML file or a TOML like string
+        try:
+            is_path = Path(config).exists()
+        except OSError:
+            # TOML strings can be too long to be a valid file name
+            is_path = False
+
+        if is_path:
+            return toml.load_file(config)
+
+        return toml.loads(config)
+    elif isinstance(config, Path):
+        # path to TOML file
+        return toml.load_file(config)
+
+    return config
+
+
 def _deepcopy_dict(item):
     _copy = {}
     for key, val in item.items():
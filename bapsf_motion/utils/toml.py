@@ -7,11 +7,15 @@ the appropriate packages based on the Python environment version and
 name wrangle the functionality to provide a consistent interface for
 `bapsf_motion`.
 """
-__all__ = ["as_toml_string"]
+__all__ = ["as_toml_string", "load_file"]
 
+import copy
+import functools
 import sys
 
 from collections import UserDict
+from pathlib import Path
+from typing import Any, Dict, Union
 from tomli_w import *
 from tomli_w import __all__ as __rall__
 
@@ -51,5 +55,27 @@ def as_toml_string(config):
     return dumps(convert_key_to_string(config))
 
 
+@functools.lru_cache(maxsize=64)
+def _load_file_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size are only used as part of the cache key, so an
+    # edited file misses the cache and is re-parsed
+    return loads(Path(path).read_bytes().decode("utf-8"))
+
+
+def load_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load and parse the TOML file located at ``path``.
+
+    Parsed files are cached on their resolved path, modification time,
+    and size, so repeated loads of an unchanged file skip parsing.  A
+    deep copy of the cached configuration is returned, so the caller
+    is free to modify it.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    config = _load_file_cached(str(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(config)
+
+
 # cleanup namespace
 del sys, __rall__, __wall__